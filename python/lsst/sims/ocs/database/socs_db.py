@@ -37,6 +37,8 @@ class SocsDatabase(object):
         The session specific instance of the database engine. SQLite only.
     session_metadata : sqlalchemy.MetaData
         The instance for holding the session specific tables. SQLite only.
+    session_conn : sqlalchemy.engine.Connection
+        The connection to the session specific database, held open across writes. SQLite only.
     session_start : int
         A new starting session Id for counting new simulations.
     """
@@ -63,6 +65,7 @@ class SocsDatabase(object):
         # Parameters for SQLite operations
         self.session_engine = None
         self.session_metadata = MetaData()
+        self.session_conn = None
 
         self.session_tracking = tables.create_session(self.metadata, autoincrement=False)
         sqlite_session_tracking_db = "{}_sessions.db".format(get_hostname())
@@ -70,6 +73,7 @@ class SocsDatabase(object):
 
         # Parameter for holding data lists
         self.data_list = collections.defaultdict(list)
+        self._write_functions = {}
 
     @property
     def data_empty(self):
@@ -186,7 +190,8 @@ class SocsDatabase(object):
         self._create_tables(self.session_metadata, use_autoincrement=False)
         self.session_metadata.create_all(self.session_engine)
         insert = self.session.insert()
-        conn = self.session_engine.connect()
+        self.session_conn = self.session_engine.connect()
+        conn = self.session_conn
         result = conn.execute(insert, sessionId=self.session_id, sessionUser=user, sessionHost=hostname,
                               sessionDate=date, version=version, runComment=run_comment)
 
@@ -202,7 +207,11 @@ class SocsDatabase(object):
         table_data: topic
             The Scheduler topic data instance.
         """
-        write_func = getattr(tables, "write_{}".format(table_name))
+        try:
+            write_func = self._write_functions[table_name]
+        except KeyError:
+            write_func = getattr(tables, "write_{}".format(table_name))
+            self._write_functions[table_name] = write_func
         result = write_func(table_data, self.session_id)
         self.data_list[table_name].append(result)
 
@@ -210,31 +219,39 @@ class SocsDatabase(object):
         """Clear all stored data lists.
         """
         self.data_list.clear()
-        self.log.log(LoggingLevel.EXTENSIVE.value, "After clearing: {}".format(self.data_list))
+        self.log.log(LoggingLevel.EXTENSIVE.value, "After clearing: %s", self.data_list)
 
     def _get_conn(self):
         """Get the DB connection.
 
+        The connection is created once and reused for all subsequent writes to avoid
+        reconnecting to the database at the end of every night.
+
         Returns
         -------
         sqlalchemy.engine.Connection
             The DB connection for the associated type.
         """
-        e = self.session_engine
-        return e.connect()
+        if self.session_conn is None:
+            self.session_conn = self.session_engine.connect()
+        return self.session_conn
 
     def write(self):
         """Write collected information into the database.
+
+        Each table's information is inserted within its own transaction, so a table that fails to
+        insert is rolled back completely and dumped to a NumPy file while the other tables are kept.
         """
         conn = self._get_conn()
 
         db_errors = []
         for table_name, table_data in self.data_list.items():
             try:
-                self.log.log(LoggingLevel.EXTENSIVE.value, "Writing {} data into DB.".format(table_name))
-                self.log.log(LoggingLevel.EXTENSIVE.value, "Length of data: {}".format(len(table_data)))
+                self.log.log(LoggingLevel.EXTENSIVE.value, "Writing %s data into DB.", table_name)
+                self.log.log(LoggingLevel.EXTENSIVE.value, "Length of data: %d", len(table_data))
                 tbl = getattr(self, table_name)
-                conn.execute(tbl.insert(), table_data)
+                with conn.begin():
+                    conn.execute(tbl.insert(), table_data)
             except exc.IntegrityError as err:
                 self.log.error("Database insertion failed for {}!".format(table_name))
                 output = collections.defaultdict(list)
@@ -246,9 +263,10 @@ class SocsDatabase(object):
                     output[k] = numpy.array(v)
 
                 filename = "{}_{}.npz".format(table_name, self.session_id)
-                numpy.savez(open(filename, 'w'), **output)
+                with open(filename, 'wb') as npz_file:
+                    numpy.savez(npz_file, **output)
                 self.log.error("Dumping information into {}".format(filename))
-                db_errors.append(err.message)
+                db_errors.append(str(err))
         if len(db_errors):
             raise SocsDatabaseError(os.linesep.join(db_errors))
 
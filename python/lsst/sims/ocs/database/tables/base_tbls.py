@@ -116,7 +116,6 @@ def create_field(metadata):
                   Column("eb", Float, nullable=False,
                          doc="The Ecliptic Latitude of the field (units=degrees)."))
 
-    Index("field_fov", table.c.fieldId, table.c.fov)
     Index("fov_gl_gb", table.c.fov, table.c.gl, table.c.gb)
     Index("fov_el_eb", table.c.fov, table.c.el, table.c.eb)
     Index("fov_ra_dec", table.c.fov, table.c.ra, table.c.dec)
@@ -448,8 +447,8 @@ def create_scheduled_downtime(metadata):
 def create_session(metadata, autoincrement=True, session_id_start=1000):
     """Create Session table.
 
-    This function creates the Session table for tracking the various simulations run. For MySQL, it adds
-    a post-create command to set the lower limit of the auto increment value.
+    This function creates the Session table for tracking the various simulations run. For MySQL with auto
+    incrementing enabled, it adds a post-create command to set the lower limit of the auto increment value.
 
     Table Description:
 
@@ -485,8 +484,9 @@ def create_session(metadata, autoincrement=True, session_id_start=1000):
 
     Index("s_host_user_date_idx", table.c.sessionUser, table.c.sessionHost, table.c.sessionDate, unique=True)
 
-    alter_table = DDL("ALTER TABLE %(table)s AUTO_INCREMENT={};".format(session_id_start))
-    event.listen(table, 'after_create', alter_table.execute_if(dialect='mysql'))
+    if autoincrement:
+        alter_table = DDL("ALTER TABLE %(table)s AUTO_INCREMENT={};".format(session_id_start))
+        event.listen(table, 'after_create', alter_table.execute_if(dialect='mysql'))
 
     return table
 
@@ -848,9 +848,7 @@ def create_target_history(metadata):
                   Column("solarElong", Float, nullable=False,
                          doc="The elongation (units=degrees) of the sun."))
 
-    Index("t_filter", table.c.filter)
-    Index("fk_TargetHistory_Session1", table.c.Session_sessionId)
-    Index("fk_TargetHistory_Field1", table.c.Field_fieldId)
+    Index("fk_TargetHistory_Field1_Session1", table.c.Field_fieldId, table.c.Session_sessionId)
 
     return table
 
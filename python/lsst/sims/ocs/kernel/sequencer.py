@@ -34,6 +34,8 @@ class Sequencer(object):
         Time (units=seconds) to wait when a missed target is received.
     log : logging.Logger
         The logging instance.
+    log_extensive : bool
+        Flag for logging at the EXTENSIVE level, set during initialization.
     """
 
     def __init__(self, obs_site_config, idle_delay, no_dds=False):
@@ -55,6 +57,7 @@ class Sequencer(object):
                                                         obs_site_config.height)
         self.observatory_state = None
         self.log = logging.getLogger("kernel.Sequencer")
+        self.log_extensive = False
         self.idle_delay = (idle_delay, "seconds")
         self.sky_model = AstronomicalSkyModel(self.observatory_location)
         self.no_dds = no_dds
@@ -122,6 +125,7 @@ class Sequencer(object):
         obs_config : :class:`.Observatory`
             The instance of the observatory configuration.
         """
+        self.log_extensive = self.log.isEnabledFor(LoggingLevel.EXTENSIVE.value)
         if self.no_dds:
             from SALPY_scheduler import scheduler_observationC
             from SALPY_scheduler import scheduler_observatoryStateC
@@ -173,7 +177,8 @@ class Sequencer(object):
             A dictionary of all the exposure information from the visit.
         """
         if target.targetId != -1:
-            self.log.log(LoggingLevel.EXTENSIVE.value, "Received target {}".format(target.targetId))
+            if self.log_extensive:
+                self.log.log(LoggingLevel.EXTENSIVE.value, "Received target %s", target.targetId)
             self.targets_received += 1
 
             self.sky_model.update(target.requestTime)
@@ -206,7 +211,8 @@ class Sequencer(object):
             self.observation.sunDec = numpy.degrees(msi["sunDec"])
             self.observation.solarElong = numpy.degrees(msi["solarElong"][0])
         else:
-            self.log.log(LoggingLevel.EXTENSIVE.value, "No target received!")
+            if self.log_extensive:
+                self.log.log(LoggingLevel.EXTENSIVE.value, "No target received!")
             self.observation.observationId = target.targetId
             self.observation.targetId = target.targetId
             if target.filter == '':
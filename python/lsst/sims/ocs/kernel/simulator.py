@@ -4,6 +4,11 @@ import logging
 import math
 import time
 import collections
+import itertools
+try:
+    from time import monotonic
+except ImportError:
+    from time import time as monotonic
 
 from scheduler_config.constants import CONFIG_DIRECTORY
 
@@ -34,6 +39,9 @@ __all__ = ["Simulator"]
 
 FilterSwap = collections.namedtuple('FilterSwap', 'need_swap filter_to_unmount filter_to_mount')
 
+SAL_POLL_INTERVAL = 0.001
+"""Time (units=seconds) to wait between unsuccessful SAL sample polls."""
+
 class Simulator(object):
     """Main class for the survey simulation.
 
@@ -69,6 +77,10 @@ class Simulator(object):
         The instance of the fields database.
     field_selection : lsst.sims.survey.fields.FieldSelection
         The instance of the field selector.
+    log_extensive : bool
+        Flag for logging at the EXTENSIVE level, set during initialization.
+    log_trace : bool
+        Flag for logging at the TRACE level, set during initialization.
     """
 
     def __init__(self, options, database, driver=None):
@@ -155,6 +167,8 @@ class Simulator(object):
         self.seeing = None
         self.filter_swap = None
         self.interested_proposal = None
+        self.log_extensive = False
+        self.log_trace = False
 
 
     @property
@@ -179,38 +193,41 @@ class Simulator(object):
             self.sal.finalize()
         self.log.info("Ending simulation")
 
-    def gather_proposal_history(self, phtype, topic):
-        """Gather the proposal history from the current target.
+    def gather_observation_proposal_history(self, topic):
+        """Gather the proposal history from the current observation.
 
         Parameters
         ----------
-        phtype : str
-            The type of the proposal history (target or observation).
-        topic : :class:`scheduler_targetC` or :class:`scheduler_interestedProposalC`
+        topic : :class:`scheduler_interestedProposalC`
             The topic instance to gather the observation proposal information from.
         """
-        if phtype == "observation":
-            for i in range(topic.numProposals):
-                self.db.append_data("observation_proposal_history",
-                                    ObsProposalHistory(self.observation_proposals_counted,
-                                                       int(topic.proposalIds[i]),
-                                                       topic.proposalValues[i],
-                                                       topic.proposalNeeds[i],
-                                                       topic.proposalBonuses[i],
-                                                       topic.proposalBoosts[i],
-                                                       topic.observationId))
-                self.observation_proposals_counted += 1
-        if phtype == "target":
-            for i in range(topic.numProposals):
-                self.db.append_data("target_proposal_history",
-                                    TargetProposalHistory(self.target_proposals_counted,
-                                                          int(topic.proposalId[i]),
-                                                          -1,
-                                                          -1,
-                                                          -1,
-                                                          -1,
-                                                          topic.targetId))
-                self.target_proposals_counted += 1
+        num_proposals = topic.numProposals
+        observation_id = topic.observationId
+        append_data = self.db.append_data
+        proposal_info = itertools.islice(zip(topic.proposalIds, topic.proposalValues, topic.proposalNeeds,
+                                             topic.proposalBonuses, topic.proposalBoosts), num_proposals)
+        for hid, (prop_id, value, need, bonus, boost) in enumerate(proposal_info,
+                                                                   self.observation_proposals_counted):
+            append_data("observation_proposal_history",
+                        ObsProposalHistory(hid, int(prop_id), value, need, bonus, boost, observation_id))
+        self.observation_proposals_counted += num_proposals
+
+    def gather_target_proposal_history(self, topic):
+        """Gather the proposal history from the current target.
+
+        Parameters
+        ----------
+        topic : :class:`scheduler_targetC`
+            The topic instance to gather the target proposal information from.
+        """
+        num_proposals = topic.numProposals
+        target_id = topic.targetId
+        append_data = self.db.append_data
+        for hid, prop_id in enumerate(itertools.islice(topic.proposalId, num_proposals),
+                                      self.target_proposals_counted):
+            append_data("target_proposal_history",
+                        TargetProposalHistory(hid, int(prop_id), -1, -1, -1, -1, target_id))
+        self.target_proposals_counted += num_proposals
 
     def get_target_from_scheduler(self):
         """Get target from scheduler.
@@ -221,16 +238,17 @@ class Simulator(object):
         if self.no_dds_comm:
             target = self.driver.select_next_target().get_copy()
             SALUtils.wtopic_target(self.target, target, self.seq.sky_model)
-        else:
-            lasttime = time.time()
-            while self.wait_for_scheduler:
-                rcode = self.sal.manager.getEvent_target(self.target)
+        elif self.wait_for_scheduler:
+            get_target = self.sal.manager.getEvent_target
+            deadline = monotonic() + self.socs_timeout
+            while True:
+                rcode = get_target(self.target)
                 if rcode == 0 and self.target.numExposures != 0:
                     break
                 else:
-                    tf = time.time()
-                    if (tf - lasttime) > self.socs_timeout:
+                    if monotonic() > deadline:
                         raise SchedulerTimeoutError("The Scheduler is not serving targets!")
+                    time.sleep(SAL_POLL_INTERVAL)
 
     def initialize(self):
         """Perform initialization steps.
@@ -240,6 +258,8 @@ class Simulator(object):
         """
         self.log.info("Initializing simulation")
         self.log.info("Simulation Session Id = {}".format(self.db.session_id))
+        self.log_extensive = self.log.isEnabledFor(LoggingLevel.EXTENSIVE.value)
+        self.log_trace = self.log.isEnabledFor(LoggingLevel.TRACE.value)
         if not self.no_dds_comm:
             self.sal.initialize()
 
@@ -360,11 +380,21 @@ class Simulator(object):
         # Note that if you are cold starting and the duration is smaller than the cold start database, you won't
         # run any simulation.
         self.log.debug("Duration = {}".format(self.duration))
+
+        # Bind frequently used attributes to locals for the visit loop.
+        th = self.time_handler
+        seq = self.seq
+        sal = self.sal
+        append_data = self.db.append_data
+        no_dds_comm = self.no_dds_comm
+        wait_for_scheduler = self.wait_for_scheduler
+        target = self.target
+
         for night in range(start_night, int(self.duration) + 1):
             self.start_night(night)
-            if self.no_dds_comm:
-                self.driver.update_time(self.time_handler.current_timestamp, night)
-                self.driver.start_night(self.time_handler.current_timestamp, night)
+            if no_dds_comm:
+                self.driver.update_time(th.current_timestamp, night)
+                self.driver.start_night(th.current_timestamp, night)
 
             if self.scheduler_state != self.summary_state_enum['ENABLE']:
                 self.log.info('Enabling scheduler...')
@@ -376,41 +406,45 @@ class Simulator(object):
                     # Scheduler not enable! Issue exception
                     raise Exception("Scheduler %s, expected ENABLE." % self.scheduler_state)
 
-            while self.time_handler.current_timestamp < self.end_of_night:
+            end_of_night = self.end_of_night
+            while th.current_timestamp < end_of_night:
+                # The time only moves when a target is observed, so grab it once per visit.
+                timestamp = th.current_timestamp
 
-                if not self.no_dds_comm:
-                    self.comm_time.timestamp = self.time_handler.current_timestamp
-                    self.sal.put(self.comm_time)
+                if not no_dds_comm:
+                    self.comm_time.timestamp = timestamp
+                    sal.put(self.comm_time)
 
-                self.log.log(LoggingLevel.EXTENSIVE.value,
-                             "Timestamp sent: {:.6f}".format(self.time_handler.current_timestamp))
+                if self.log_extensive:
+                    self.log.log(LoggingLevel.EXTENSIVE.value, "Timestamp sent: %.6f", timestamp)
 
-                observatory_state = self.seq.get_observatory_state(self.time_handler.current_timestamp)
-                self.log.log(LoggingLevel.EXTENSIVE.value,
-                             "Observatory State: {}".format(topic_strdict(observatory_state)))
-                if self.no_dds_comm:
-                    self.driver.update_time(self.time_handler.current_timestamp, night)
+                observatory_state = seq.get_observatory_state(timestamp)
+                if self.log_extensive:
+                    self.log.log(LoggingLevel.EXTENSIVE.value, "Observatory State: %s",
+                                 topic_strdict(observatory_state))
+                if no_dds_comm:
+                    self.driver.update_time(timestamp, night)
                     driver_observatory_state = SALUtils.rtopic_observatory_state(observatory_state)
                     self.driver.update_internal_conditions(driver_observatory_state, night)
-                    self.cloud.bulkCloud = self.cloud_interface.get_cloud(self.time_handler.time_since_start)
-                    self.seeing.seeing = self.seeing_interface.get_seeing(self.time_handler.time_since_start)
+                    time_since_start = th.time_since_start
+                    self.cloud.bulkCloud = self.cloud_interface.get_cloud(time_since_start)
+                    self.seeing.seeing = self.seeing_interface.get_seeing(time_since_start)
                     self.driver.update_external_conditions(self.cloud.bulkCloud, self.seeing.seeing)
                 else:
-                    self.sal.put(observatory_state)
+                    sal.put(observatory_state)
 
-                    self.cloud_interface.set_topic(self.time_handler, self.cloud)
-                    self.sal.put(self.cloud)
+                    self.cloud_interface.set_topic(th, self.cloud)
+                    sal.put(self.cloud)
 
-                    self.seeing_interface.set_topic(self.time_handler, self.seeing)
-                    self.sal.put(self.seeing)
+                    self.seeing_interface.set_topic(th, self.seeing)
+                    sal.put(self.seeing)
 
                 self.get_target_from_scheduler()
 
-                observation, slew_info, exposure_info = self.seq.observe_target(self.target,
-                                                                                self.time_handler)
+                observation, slew_info, exposure_info = seq.observe_target(target, th)
                 # Add a few more things to the observation
                 observation.night = night
-                elapsed_time = self.time_handler.time_since_given(observation.observationStartTime)
+                elapsed_time = th.time_since_given(observation.observationStartTime)
                 observation.cloud = self.cloud_interface.get_cloud(elapsed_time)
                 seeing_values = self.seeing_interface.calculate_seeing(elapsed_time, observation.filter,
                                                                    observation.airmass)
@@ -418,20 +452,24 @@ class Simulator(object):
                 observation.seeingFwhmGeom = seeing_values[1]
                 observation.seeingFwhmEff = seeing_values[2]
 
-                visit_exposure_time = sum([observation.exposureTimes[i]
-                                           for i in range(observation.numExposures)])
+                visit_exposure_time = sum(itertools.islice(observation.exposureTimes,
+                                                           observation.numExposures))
                 observation.fiveSigmaDepth = m5_flat_sed(observation.filter,
                                                            observation.skyBrightness,
                                                            observation.seeingFwhmEff,
                                                            visit_exposure_time,
                                                            observation.airmass)
 
-                observation.note = self.target.note
-                observation.numProposals = self.target.numProposals
-                for i in range(self.target.numProposals):
-                    observation.proposalIds[i] = self.target.proposalId[i]
-                self.log.log(LoggingLevel.EXTENSIVE.value, "tx: observation")
-                if self.no_dds_comm:
+                observation.note = target.note
+                num_proposals = target.numProposals
+                observation.numProposals = num_proposals
+                proposal_ids = observation.proposalIds
+                target_proposal_ids = target.proposalId
+                for i in range(num_proposals):
+                    proposal_ids[i] = target_proposal_ids[i]
+                if self.log_extensive:
+                    self.log.log(LoggingLevel.EXTENSIVE.value, "tx: observation")
+                if no_dds_comm:
                     driver_observation = SALUtils.rtopic_observation(observation)
                     self.log.debug('%i: %s', observation.numProposals, observation.proposalIds)
                     self.log.debug('%i: %s', driver_observation.num_props,
@@ -441,45 +479,48 @@ class Simulator(object):
                                                        observation.targetId,
                                                        target_list)
                 else:
-                    self.sal.put(observation)
+                    sal.put(observation)
 
                     # Wait for interested proposal information
-                    lastconfigtime = time.time()
-                    while self.wait_for_scheduler:
-                        rcode = self.sal.manager.getNextSample_interestedProposal(self.interested_proposal)
+                    deadline = monotonic() + 5.0
+                    while wait_for_scheduler:
+                        rcode = sal.manager.getNextSample_interestedProposal(self.interested_proposal)
                         if rcode == 0 and self.interested_proposal.numProposals >= 0:
-                            self.log.log(LoggingLevel.EXTENSIVE.value, "Received interested proposal.")
+                            if self.log_extensive:
+                                self.log.log(LoggingLevel.EXTENSIVE.value, "Received interested proposal.")
                             break
                         else:
-                            tf = time.time()
-                            if (tf - lastconfigtime) > 5.0:
-                                self.log.log(LoggingLevel.EXTENSIVE.value,
-                                             "Failed to receive interested proposal due to timeout.")
+                            if monotonic() > deadline:
+                                if self.log_extensive:
+                                    self.log.log(LoggingLevel.EXTENSIVE.value,
+                                                 "Failed to receive interested proposal due to timeout.")
                                 break
+                            time.sleep(SAL_POLL_INTERVAL)
 
-                if self.wait_for_scheduler and observation.targetId != -1:
-                    self.db.append_data("target_history", self.target)
-                    self.db.append_data("observation_history", observation)
-                    self.gather_proposal_history("target", self.target)
-                    self.gather_proposal_history("observation", self.interested_proposal)
+                if wait_for_scheduler and observation.targetId != -1:
+                    append_data("target_history", target)
+                    append_data("observation_history", observation)
+                    self.gather_target_proposal_history(target)
+                    self.gather_observation_proposal_history(self.interested_proposal)
                     for slew_type, slew_data in slew_info.items():
-                        self.log.log(LoggingLevel.TRACE.value, "{}, {}".format(slew_type, type(slew_data)))
+                        if self.log_trace:
+                            self.log.log(LoggingLevel.TRACE.value, "%s, %s", slew_type, type(slew_data))
                         if isinstance(slew_data, list):
                             for data in slew_data:
-                                self.db.append_data(slew_type, data)
+                                append_data(slew_type, data)
                         else:
-                            self.db.append_data(slew_type, slew_data)
+                            append_data(slew_type, slew_data)
                     for exposure_type in exposure_info:
-                        self.log.log(LoggingLevel.TRACE.value, "Adding {} to DB".format(exposure_type))
-                        self.log.log(LoggingLevel.TRACE.value,
-                                     "Number of exposures being added: "
-                                     "{}".format(len(exposure_info[exposure_type])))
+                        if self.log_trace:
+                            self.log.log(LoggingLevel.TRACE.value, "Adding %s to DB", exposure_type)
+                            self.log.log(LoggingLevel.TRACE.value, "Number of exposures being added: %d",
+                                         len(exposure_info[exposure_type]))
                         for exposure in exposure_info[exposure_type]:
-                            self.db.append_data(exposure_type, exposure)
+                            append_data(exposure_type, exposure)
 
             self.end_night()
-            if self.no_dds_comm:
-                self.driver.end_night(self.time_handler.current_timestamp, night)
+            if no_dds_comm:
+                self.driver.end_night(th.current_timestamp, night)
             self.start_day()
 
     def save_configuration(self):
@@ -492,7 +533,7 @@ class Simulator(object):
         c.append(("dateloc/version", dateloc_version.__version__))
         c.append(("astrosky_model/version", astrosky_version.__version__))
         c.append(("observatory_model/version", obs_mod_version.__version__))
-        config_list = [write_config((i + 1, x[0], x[1]), self.db.session_id) for i, x in enumerate(c)]
+        config_list = [write_config((i, x[0], x[1]), self.db.session_id) for i, x in enumerate(c, 1)]
         self.db.write_table("config", config_list)
 
     def save_field_information(self):
@@ -506,17 +547,11 @@ class Simulator(object):
     def save_proposal_information(self):
         """Save the active proposal information to the DB.
         """
-        proposals = []
-        prop_count = 0
-        for i, general in enumerate(self.conf_comm.survey_topology['general']):
-            proposals.append(write_proposal(ProposalInfo(i+1, general, "General"),
-                                            self.db.session_id))
-            prop_count += 1
-
-        for i, sequence in enumerate(self.conf_comm.survey_topology['sequence']):
-            proposals.append(write_proposal(ProposalInfo(prop_count+i+1, sequence, "Sequence"),
-                                            self.db.session_id))
-            prop_count += 1
+        survey_topology = self.conf_comm.survey_topology
+        prop_names = itertools.chain(((general, "General") for general in survey_topology['general']),
+                                     ((sequence, "Sequence") for sequence in survey_topology['sequence']))
+        proposals = [write_proposal(ProposalInfo(i, name, prop_type), self.db.session_id)
+                     for i, (name, prop_type) in enumerate(prop_names, 1)]
 
         self.db.write_table("proposal", proposals)
 
@@ -532,10 +567,10 @@ class Simulator(object):
         if not self.no_dds_comm:
             self.comm_time.timestamp = self.time_handler.current_timestamp
             self.sal.put(self.comm_time)
-        self.log.debug("Start of day {} at {}".format(self.comm_time.night,
-                                                      self.time_handler.current_timestring))
-        self.log.log(LoggingLevel.EXTENSIVE.value,
-                     "Daytime Timestamp sent: {:.6f}".format(self.time_handler.current_timestamp))
+        self.log.debug("Start of day %s at %s", self.comm_time.night, self.time_handler.current_timestring)
+        if self.log_extensive:
+            self.log.log(LoggingLevel.EXTENSIVE.value,
+                         "Daytime Timestamp sent: %.6f", self.time_handler.current_timestamp)
 
         if self.no_dds_comm:
             filter_swap = self.driver.get_need_filter_swap()
@@ -543,15 +578,15 @@ class Simulator(object):
             self.filter_swap.filterToUnmount = filter_swap[1]
         else:
             self.filter_swap = self.sal.set_subscribe_logevent("needFilterSwap")
-            lastconfigtime = time.time()
+            deadline = monotonic() + 5.0
             while self.wait_for_scheduler:
                 rcode = self.sal.manager.getEvent_needFilterSwap(self.filter_swap)
                 if rcode == 0 and self.filter_swap.filterToUnmount != '':
                     break
                 else:
-                    tf = time.time()
-                    if (tf - lastconfigtime) > 5.0:
+                    if monotonic() > deadline:
                         break
+                    time.sleep(SAL_POLL_INTERVAL)
 
         self.seq.start_day(self.filter_swap)
 
@@ -563,7 +598,7 @@ class Simulator(object):
         night : int
             The current night.
         """
-        self.log.info("Night {}".format(night))
+        self.log.info("Night %s", night)
         self.seq.start_night(night, self.duration)
         self.comm_time.night = night
 
@@ -580,38 +615,35 @@ class Simulator(object):
         self.time_handler.update_time(delta, "seconds")
         self.log.debug("Timestamp: %.6f", self.time_handler.current_timestamp)
 
-        self.log.debug("Start of night {} at {}".format(night, self.time_handler.current_timestring))
+        self.log.debug("Start of night %s at %s", night, self.time_handler.current_timestring)
 
         self.end_of_night = rise_timestamp
 
         end_of_night_str = self.time_handler.future_timestring(0, "seconds", timestamp=self.end_of_night)
-        self.log.debug("End of night {} at {}".format(night, end_of_night_str))
+        self.log.debug("End of night %s at %s", night, end_of_night_str)
 
         self.db.clear_data()
 
         down_days = self.dh.get_downtime(night)
+        if not self.no_dds_comm:
+            self.comm_time.isDown = down_days > 0
+            self.comm_time.downDuration = down_days
         if down_days:
-            self.log.info("Observatory is down: {} days.".format(down_days))
-            if not self.no_dds_comm:
-                self.comm_time.is_down = True
-                self.comm_time.down_duration = down_days
-                self.comm_time.timestamp = self.time_handler.current_timestamp
-            self.log.log(LoggingLevel.EXTENSIVE.value,
-                         "Downtime Start Night Timestamp sent: {:.6f}"
-                         .format(self.time_handler.current_timestamp))
+            self.log.info("Observatory is down: %s days.", down_days)
+            timestamp = self.time_handler.current_timestamp
+            observatory_state = self.seq.get_observatory_state(timestamp)
+            if self.log_extensive:
+                self.log.log(LoggingLevel.EXTENSIVE.value, "Downtime Start Night Timestamp sent: %.6f",
+                             timestamp)
+                self.log.log(LoggingLevel.EXTENSIVE.value, "Downtime Observatory State: %s",
+                             topic_strdict(observatory_state))
             if not self.no_dds_comm:
+                self.comm_time.timestamp = timestamp
                 self.sal.put(self.comm_time)
-            observatory_state = self.seq.get_observatory_state(self.time_handler.current_timestamp)
-            self.log.log(LoggingLevel.EXTENSIVE.value,
-                         "Downtime Observatory State: {}".format(topic_strdict(observatory_state)))
-            if not self.no_dds_comm:
                 self.sal.put(observatory_state)
 
-            delta = math.fabs(self.time_handler.current_timestamp - self.end_of_night) + SECONDS_IN_MINUTE
+            delta = abs(timestamp - self.end_of_night) + SECONDS_IN_MINUTE
             self.time_handler.update_time(delta, "seconds")
-        elif not self.no_dds_comm:
-            self.comm_time.isDown = False
-            self.comm_time.downDuration = down_days
 
     def write_proposal_fields(self, prop_fields):
         """Transform the proposal field information and write to the survey database.
@@ -727,26 +759,26 @@ class Simulator(object):
 
     def listen_scheduler_state(self):
 
-        lasttime = time.time()
+        deadline = monotonic() + self.socs_timeout
         while self.wait_for_scheduler:
             rcode = self.sal.manager.getEvent_summaryState(self.scheduler_summary_state)
             if rcode == 0:
                 break
             else:
-                tf = time.time()
-                if (tf - lasttime) > self.socs_timeout:
+                if monotonic() > deadline:
                     raise SchedulerTimeoutError("Could not listen to Scheduler state!")
+                time.sleep(SAL_POLL_INTERVAL)
         return rcode
 
     def listen_scheduler_settings(self):
 
-        lasttime = time.time()
+        deadline = monotonic() + self.socs_timeout
         while self.wait_for_scheduler:
             rcode = self.sal.manager.getEvent_validSettings(self.scheduler_valid_settings)
             if rcode == 0:
                 break
             else:
-                tf = time.time()
-                if (tf - lasttime) > self.socs_timeout:
+                if monotonic() > deadline:
                     raise SchedulerTimeoutError("Could not listen to Scheduler state!")
+                time.sleep(SAL_POLL_INTERVAL)
         return rcode
\ No newline at end of file
@@ -57,11 +57,24 @@ class TimeHandler(object):
         """
         return self._time_difference(self.initial_dt)
 
+    @property
+    def current_dt(self):
+        """datetime.datetime: The current simulation date/time.
+        """
+        return self._current_dt
+
+    @current_dt.setter
+    def current_dt(self, value):
+        self._current_dt = value
+        self._current_timestamp = self._time_difference(value)
+
     @property
     def current_timestamp(self):
         """float: Return the UNIX timestamp for the current date/time.
+
+        The timestamp is stored whenever current_dt is set instead of being recalculated on each access.
         """
-        return self._time_difference(self.current_dt)
+        return self._current_timestamp
 
     @property
     def current_midnight_timestamp(self):
@@ -88,7 +101,8 @@ class TimeHandler(object):
         """Update the currently held timestamp.
 
         This function updates the currently held time with the given increment and corresponding
-        units.
+        units. Increments in seconds, which is what the simulation uses for slews and visits, skip
+        building the keyword dictionary.
 
         Parameters
         ----------
@@ -97,8 +111,11 @@ class TimeHandler(object):
         time_units : str
             The time unit for the increment value.
         """
-        time_delta_dict = {time_units: time_increment}
-        self.current_dt += timedelta(**time_delta_dict)
+        if time_units == "seconds":
+            self.current_dt += timedelta(seconds=time_increment)
+        else:
+            time_delta_dict = {time_units: time_increment}
+            self.current_dt += timedelta(**time_delta_dict)
 
     @property
     def current_timestring(self):
@@ -29,6 +29,8 @@ class MainObservatory(object):
     ----------
     log : logging.Logger
         The logging instance.
+    log_extensive : bool
+        Flag for logging at the EXTENSIVE level, set during configuration.
     model : lsst.ts.scheduler.observatory_model.ObservatoryModel
         The instance of the Observatory model from the LSST Scheduler.
     param_dict : dict
@@ -44,6 +46,7 @@ class MainObservatory(object):
             The instance of the observing site configuration.
         """
         self.log = logging.getLogger("observatory.MainObservatory")
+        self.log_extensive = False
         observatory_location = ObservatoryLocation()
         observatory_location.configure({"obs_site": obs_site_config.toDict()})
         self.config = None
@@ -129,6 +132,7 @@ class MainObservatory(object):
         obs_config : :class:`.Observatory`
             The instance of the observatory configuration.
         """
+        self.log_extensive = self.log.isEnabledFor(LoggingLevel.EXTENSIVE.value)
         self.config = obs_config
         self.param_dict.update(self.config.toDict())
         self.model.configure(self.param_dict)
@@ -195,22 +199,27 @@ class MainObservatory(object):
         """
         self.observations_made += 1
 
-        self.log.log(LoggingLevel.EXTENSIVE.value,
-                     "Starting observation {} for target {}.".format(self.observations_made,
-                                                                     target.targetId))
+        if self.log_extensive:
+            self.log.log(LoggingLevel.EXTENSIVE.value, "Starting observation %d for target %s.",
+                         self.observations_made, target.targetId)
 
         slew_time = self.slew(target)
         time_handler.update_time(*slew_time)
 
+        start_time = time_handler.current_timestamp
         observation.observationId = self.observations_made
-        observation.observationStartTime = time_handler.current_timestamp
-        start_mjd, start_lst = self.date_profile(observation.observationStartTime)
+        observation.observationStartTime = start_time
+        start_mjd, start_lst = self.date_profile(start_time)
         observation.observationStartMjd = start_mjd
         observation.observationStartLst = math.degrees(start_lst)
         observation.targetId = target.targetId
-        observation.numProposals = target.numProposals
-        for i in range(observation.numProposals):
-            observation.proposalIds[i] = target.proposalId[i]
+        # Read the topic attributes once instead of once per proposal.
+        num_proposals = target.numProposals
+        observation.numProposals = num_proposals
+        proposal_ids = observation.proposalIds
+        target_proposal_ids = target.proposalId
+        for i in range(num_proposals):
+            proposal_ids[i] = target_proposal_ids[i]
         # observation.fieldId = target.fieldId
         # observation.groupId = target.groupId
         observation.filter = target.filter
@@ -220,11 +229,13 @@ class MainObservatory(object):
         observation.numExposures = target.numExposures
         observation.slewTime = slew_time[0]
 
-        self.log.log(LoggingLevel.EXTENSIVE.value,
-                     "Exposure Times for Target {}: {}".format(target.targetId, list(target.exposureTimes)))
+        if self.log_extensive:
+            self.log.log(LoggingLevel.EXTENSIVE.value, "Exposure Times for Target %s: %s",
+                         target.targetId, list(target.exposureTimes))
         visit_time = self.calculate_visit_time(target, time_handler)
-        self.log.log(LoggingLevel.EXTENSIVE.value,
-                     "Visit Time for Target {}: {}".format(target.targetId, visit_time[0]))
+        if self.log_extensive:
+            self.log.log(LoggingLevel.EXTENSIVE.value, "Visit Time for Target %s: %s",
+                         target.targetId, visit_time[0])
 
         observation.visitTime = visit_time[0]
         for i, exposure in enumerate(self.observation_exposure_list):
@@ -232,9 +243,9 @@ class MainObservatory(object):
 
         time_handler.update_time(*visit_time)
 
-        self.log.log(LoggingLevel.EXTENSIVE.value,
-                     "Observation {} completed at {}.".format(self.observations_made,
-                                                              time_handler.current_timestring))
+        if self.log_extensive:
+            self.log.log(LoggingLevel.EXTENSIVE.value, "Observation %d completed at %s.",
+                         self.observations_made, time_handler.current_timestring)
 
         slew_info = {"slew_history": self.slew_history, "slew_initial_state": self.slew_initial_state,
                      "slew_final_state": self.slew_final_state, "slew_activities": self.slew_activities_list,
@@ -259,16 +270,16 @@ class MainObservatory(object):
             The time to slew the telescope from its current position to the target position.
         """
         self.slew_count += 1
-        self.log.log(LoggingLevel.TRACE.value, "Slew count: {}".format(self.slew_count))
+        self.log.log(LoggingLevel.TRACE.value, "Slew count: %d", self.slew_count)
         initial_slew_state = copy.deepcopy(self.model.current_state)
-        self.log.log(LoggingLevel.TRACE.value, "Initial slew state: {}".format(initial_slew_state))
+        self.log.log(LoggingLevel.TRACE.value, "Initial slew state: %s", initial_slew_state)
         self.slew_initial_state = self.get_slew_state(initial_slew_state)
 
         sched_target = Target.from_topic(target)
         self.model.slew(sched_target)
 
         final_slew_state = copy.deepcopy(self.model.current_state)
-        self.log.log(LoggingLevel.TRACE.value, "Final slew state: {}".format(final_slew_state))
+        self.log.log(LoggingLevel.TRACE.value, "Final slew state: %s", final_slew_state)
         self.slew_final_state = self.get_slew_state(final_slew_state)
 
         slew_time = (final_slew_state.time - initial_slew_state.time, "seconds")
@@ -20,6 +20,7 @@ class SalManager(object):
         """
         self.debug_level = debug_level
         self.manager = None
+        self._put_functions = {}
 
     def initialize(self):
         """Perform initialization steps.
@@ -28,6 +29,7 @@ class SalManager(object):
         """
         self.manager = SALPY_scheduler.SAL_scheduler()
         self.manager.setDebugLevel(self.debug_level)
+        self._put_functions.clear()
 
     def finalize(self):
         """Perform finalization steps.
@@ -119,15 +121,21 @@ class SalManager(object):
         """Publish the topic.
 
         This function does the actual work of publishing the given telemetry topic data structure. The type
-        is inferred from the topic object itself.
+        is inferred from the topic object itself. The publishing function for a given topic type is looked
+        up once and cached for subsequent calls.
 
         Parameters
         ----------
         topic_obj : SALPY_scheduler.<topic_obj>
             The telemetry topic data structure.
         """
-        name = str(type(topic_obj)).strip("\"\'<>\'").split("_")[-1][:-1]
-        func = getattr(self.manager, "putSample_{}".format(name))
+        topic_type = type(topic_obj)
+        try:
+            func = self._put_functions[topic_type]
+        except KeyError:
+            name = str(topic_type).strip("\"\'<>\'").split("_")[-1][:-1]
+            func = getattr(self.manager, "putSample_{}".format(name))
+            self._put_functions[topic_type] = func
         func(topic_obj)
 
     def send_command(self, cmd, **kwargs):
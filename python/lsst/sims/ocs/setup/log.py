@@ -1,7 +1,12 @@
+import atexit
 from enum import Enum
 import logging
 import logging.handlers
 import os
+try:
+    import queue
+except ImportError:
+    import Queue as queue
 
 from lsst.sims.ocs.utilities import get_hostname
 
@@ -35,7 +40,10 @@ DETAIL_LEVEL = {
 def configure_logging(console_detail, file_detail, log_port=logging.handlers.DEFAULT_TCP_LOGGING_PORT):
     """Configure logging for the application.
 
-    Configuration for both the console and file (via socket) logging for the application.
+    Configuration for both the console and file (via socket) logging for the application. Records
+    for the socket logger are placed on a queue and sent from a background thread, so the simulation
+    does not wait on the network for each message. The socket handler is attached directly when the
+    queue handlers are not available (Python 2).
 
     Parameters
     ----------
@@ -49,8 +57,9 @@ def configure_logging(console_detail, file_detail, log_port=logging.handlers.DEF
     main_level = max(console_detail, file_detail)
     logging.basicConfig(level=DETAIL_LEVEL[main_level], format=CONSOLE_FORMAT)
     logging.captureWarnings(True)
+    root_logger = logging.getLogger()
     # Remove old console logger as it will double up messages when levels match.
-    logging.getLogger().removeHandler(logging.getLogger().handlers[0])
+    root_logger.removeHandler(root_logger.handlers[0])
 
     for level in LoggingLevel:
         logging.addLevelName(level.value, level.name)
@@ -58,10 +67,19 @@ def configure_logging(console_detail, file_detail, log_port=logging.handlers.DEF
     ch = logging.StreamHandler()
     ch.setLevel(DETAIL_LEVEL[console_detail])
     ch.setFormatter(logging.Formatter(CONSOLE_FORMAT))
-    logging.getLogger().addHandler(ch)
+    root_logger.addHandler(ch)
 
     sh = logging.handlers.SocketHandler('localhost', log_port)
-    logging.getLogger().addHandler(sh)
+    try:
+        log_queue = queue.Queue(-1)
+        qh = logging.handlers.QueueHandler(log_queue)
+        listener = logging.handlers.QueueListener(log_queue, sh)
+    except AttributeError:
+        root_logger.addHandler(sh)
+    else:
+        root_logger.addHandler(qh)
+        listener.start()
+        atexit.register(listener.stop)
 
 def set_log_levels(verbose=0):
     """Set detail levels for console and file logging systems.
@@ -11,6 +11,7 @@ except ImportError:
 
 from lsst.sims.ocs.database.socs_db import SocsDatabase
 from lsst.sims.ocs.database.tables import write_target_history
+from lsst.sims.ocs.utilities.socs_exceptions import SocsDatabaseError
 from . import topic_helpers
 
 class SocsDatabaseSqliteTest(unittest.TestCase):
@@ -28,6 +29,9 @@ class SocsDatabaseSqliteTest(unittest.TestCase):
         session_db_name = "{}_{}.db".format(self.hostname, self.session_id)
         if os.path.exists(session_db_name):
             os.remove(session_db_name)
+        dump_file = "target_history_{}.npz".format(self.session_id)
+        if os.path.exists(dump_file):
+            os.remove(dump_file)
         if os.path.exists(self.db_name):
             os.remove(self.db_name)
 
@@ -107,6 +111,24 @@ class SocsDatabaseSqliteTest(unittest.TestCase):
         self.db.write()
         self.check_db_file_for_target_info()
 
+    @mock.patch("lsst.sims.ocs.database.socs_db.get_hostname")
+    def test_write_data_integrity_error(self, mock_get_hostname):
+        mock_get_hostname.return_value = self.hostname
+        self.setup_db("This is my cool test!")
+        self.create_append_data()
+        self.create_append_data()
+
+        with self.assertRaises(SocsDatabaseError):
+            self.db.write()
+
+        self.assertTrue(os.path.exists("target_history_{}.npz".format(self.session_id)))
+        session_db_name = "{}_{}.db".format(self.hostname, self.session_id)
+        engine = create_engine("sqlite:///{}".format(session_db_name))
+        conn = engine.connect()
+        result = conn.execute(select([self.db.target_history]))
+        self.assertIsNone(result.fetchone())
+        conn.close()
+
     @mock.patch("lsst.sims.ocs.database.socs_db.get_hostname")
     def test_write_table_data(self, mock_get_hostname):
         mock_get_hostname.return_value = self.hostname
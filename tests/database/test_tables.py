@@ -31,7 +31,7 @@ class TablesTest(unittest.TestCase):
     def test_create_target_history_table(self):
         targets = tbls.create_target_history(self.metadata)
         self.assertEqual(len(targets.c), 32)
-        self.assertEqual(len(targets.indexes), 3)
+        self.assertEqual(len(targets.indexes), 1)
 
     def test_write_target_history_table(self):
         target_topic = topic_helpers.target
@@ -58,7 +58,7 @@ class TablesTest(unittest.TestCase):
     def test_create_field_table(self):
         fields = tbls.create_field(self.metadata)
         self.assertEqual(len(fields.c), 9)
-        self.assertEqual(len(fields.indexes), 4)
+        self.assertEqual(len(fields.indexes), 3)
 
     def test_write_field_table(self):
         field_topic = topic_helpers.field_tuple
@@ -1,6 +1,6 @@
 from __future__ import division
 from builtins import range
-from datetime import datetime
+import collections
 import unittest
 
 try:
@@ -8,7 +8,7 @@ try:
 except ImportError:
     import mock
 
-from lsst.ts.schedulerConfig.sim_config import SimulationConfig
+from lsst.sims.ocs.database.socs_db import SocsDatabase
 from lsst.sims.ocs.kernel.simulator import Simulator
 import SALPY_scheduler
 
@@ -17,44 +17,68 @@ from tests.database.topic_helpers import slew_activity_coll
 from tests.helpers import CONFIG_COMM_PUT_CALLS, NUM_GEN_PROPS, NUM_SEQ_PROPS
 from tests.helpers import MOON_SUN_INFO, SKY_BRIGHTNESS, SKY_BRIGHTNESS_PRE_HEADER, TARGET_INFO
 
+TOPIC_CLASSES = {}
+
+DateProfile = collections.namedtuple("DateProfile", "mjd")
+
+SLEW_MOCK = mock.Mock(return_value=(6.0, "seconds"))
+VISIT_TIME_MOCK = mock.Mock(return_value=(34.0, "seconds"))
+WRITE_DOWNTIME_MOCK = mock.Mock()
+WRITE_CLOUD_MOCK = mock.Mock()
+WRITE_SEEING_MOCK = mock.Mock()
+SHARED_MOCKS = (SLEW_MOCK, VISIT_TIME_MOCK, WRITE_DOWNTIME_MOCK, WRITE_CLOUD_MOCK, WRITE_SEEING_MOCK)
+
+SCHEDULER_RETURN_VALUES = {
+    "getEvent_summaryState.return_value": 0,
+    "getEvent_validSettings.return_value": 0,
+    "getEvent_target.return_value": 0,
+    "getEvent_needFilterSwap.return_value": 0,
+    "getNextSample_interestedProposal.return_value": 0
+}
+
+ASTRO_SKY_RETURN_VALUES = {
+    "get_sky_brightness.return_value": SKY_BRIGHTNESS,
+    "get_target_information.return_value": TARGET_INFO,
+    "get_moon_sun_info.return_value": MOON_SUN_INFO,
+    "sky_brightness_config.return_value": SKY_BRIGHTNESS_PRE_HEADER
+}
+
 class SimulatorTest(unittest.TestCase):
 
     def setUp(self):
         self.time_tolerance = 1e-6
         self.starting_timestamp = 1664582400.0
 
-        patcher1 = mock.patch("lsst.sims.ocs.sal.sal_manager.SalManager.set_publish_topic")
+        patcher1 = mock.patch.multiple("lsst.sims.ocs.sal.sal_manager.SalManager",
+                                       set_publish_topic=mock.DEFAULT, set_subscribe_topic=mock.DEFAULT)
         self.addCleanup(patcher1.stop)
-        self.mock_salmanager_pub_topic = patcher1.start()
-        patcher2 = mock.patch("lsst.sims.ocs.sal.sal_manager.SalManager.set_subscribe_topic")
+        mock_salmanager = patcher1.start()
+        self.mock_salmanager_pub_topic = mock_salmanager["set_publish_topic"]
+        self.mock_salmanager_sub_topic = mock_salmanager["set_subscribe_topic"]
+        self.mock_socs_db = mock.MagicMock(spec=SocsDatabase)
+        self.mock_socs_db.session_id = 1001
+        patcher2 = mock.patch("lsst.sims.ocs.kernel.sequencer.AstronomicalSkyModel", spec=True)
         self.addCleanup(patcher2.stop)
-        self.mock_salmanager_sub_topic = patcher2.start()
-        patcher3 = mock.patch("lsst.sims.ocs.database.socs_db.SocsDatabase", spec=True)
-        self.addCleanup(patcher3.stop)
-        self.mock_socs_db = patcher3.start()
-        patcher4 = mock.patch("lsst.sims.ocs.kernel.sequencer.AstronomicalSkyModel", spec=True)
-        self.addCleanup(patcher4.stop)
-        self.mock_astro_sky = patcher4.start()
-
-        import collections
-
-        self.options = collections.namedtuple("options", ["frac_duration", "no_scheduler",
-                                                          "scheduler_version", "scheduler_timeout"])
+        self.mock_astro_sky = patcher2.start()
+
+        self.options = collections.namedtuple("options", ["frac_duration", "no_scheduler", "config_path",
+                                                          "scheduler_version", "scheduler_timeout",
+                                                          "config_version"])
         self.options.frac_duration = 0.5
+        self.options.config_path = None
         self.options.no_scheduler = True
         self.options.scheduler_version = "v0.8"
         self.options.scheduler_timeout = 60.0
+        self.options.config_version = "master"
 
-        self.configuration = SimulationConfig()
-        self.configuration.load_proposals()
-
-        self.sim = Simulator(self.options, self.configuration, self.mock_socs_db)
-
-    def update_timestamp(self, timestamp):
-        self.sim.time_handler.current_dt = datetime.utcfromtimestamp(timestamp)
+        self.sim = Simulator(self.options, self.mock_socs_db)
 
     def topic_get(self, *args):
-        topic = getattr(SALPY_scheduler, "scheduler_{}C".format(args[0]))
+        try:
+            topic = TOPIC_CLASSES[args[0]]
+        except KeyError:
+            topic = getattr(SALPY_scheduler, "scheduler_{}C".format(args[0]))
+            TOPIC_CLASSES[args[0]] = topic
         return topic()
 
     def test_basic_information_after_creation(self):
@@ -67,16 +91,12 @@ class SimulatorTest(unittest.TestCase):
         self.assertEqual(self.sim.duration, 1.0)
 
     def test_no_override_from_options(self):
-        # Need to use a new instance since self.configuration is modified.
-        configuration = SimulationConfig()
-        configuration.load_proposals()
         self.options.frac_duration = -1
-        sim = Simulator(self.options, configuration, self.mock_socs_db)
+        sim = Simulator(self.options, self.mock_socs_db)
         self.assertEquals(sim.duration, 3650.0)
 
     @mock.patch("lsst.sims.ocs.kernel.sequencer.Sequencer.initialize")
     def test_initialization(self, mock_sequencer_init):
-        self.mock_socs_db.session_id = 1001
         self.sim.initialize()
         expected_calls = CONFIG_COMM_PUT_CALLS + NUM_GEN_PROPS + NUM_SEQ_PROPS
         self.assertEqual(self.mock_salmanager_pub_topic.call_count, expected_calls)
@@ -88,21 +108,23 @@ class SimulatorTest(unittest.TestCase):
         self.sim.finalize()
         self.assertEqual(mock_salmanager_final.call_count, 1)
 
-    def short_run(self, wait_for_sched):
+    def short_run(self):
+        patcher1 = mock.patch("lsst.sims.ocs.sal.sal_manager.SalManager.put")
+        self.addCleanup(patcher1.stop)
+        self.mock_salmanager_put = patcher1.start()
+        patcher2 = mock.patch("SALPY_scheduler.SAL_scheduler")
+        self.addCleanup(patcher2.stop)
+        self.mock_salscheduler = patcher2.start()
+
         self.mock_salmanager_pub_topic.side_effect = self.topic_get
         self.mock_salmanager_sub_topic.side_effect = self.topic_get
-        self.mock_socs_db.session_id = 1001
-        mock_dateprofile = mock.MagicMock(mjd=59280.1)
-        mas = self.mock_astro_sky.return_value
-        mas.date_profile = mock_dateprofile
-        mas.get_sky_brightness.return_value = SKY_BRIGHTNESS
-        mas.get_target_information.return_value = TARGET_INFO
-        mas.get_moon_sun_info.return_value = MOON_SUN_INFO
-        mas.sky_brightness_config.return_value = SKY_BRIGHTNESS_PRE_HEADER
-
-        # Setup for 1 night and 9 visits
+        date_profile = DateProfile(59280.1)
+        self.mock_astro_sky.return_value.configure_mock(date_profile=date_profile,
+                                                        **ASTRO_SKY_RETURN_VALUES)
+
+        # Setup for 1 night and 2 visits
         self.num_nights = 1
-        self.num_visits = 9
+        self.num_visits = 2
         # Timestamp, cloud, seeing, observatory state and observation per visit
         # Timestamp per day
         self.put_calls = 5 * self.num_visits + self.num_nights
@@ -111,63 +133,68 @@ class SimulatorTest(unittest.TestCase):
         self.put_calls += NUM_GEN_PROPS
         self.put_calls += NUM_SEQ_PROPS
         self.sim.fractional_duration = 1 / 365
-        self.sim.wait_for_scheduler = wait_for_sched
+        self.sim.wait_for_scheduler = True
         self.mock_astro_sky.return_value.get_night_boundaries.return_value = \
-            (self.starting_timestamp, self.starting_timestamp + 360.0)
-        self.sim.seq.observatory_model.slew = mock.Mock(return_value=((6.0, "seconds")))
-        self.sim.seq.observatory_model.calculate_visit_time = mock.Mock(return_value=((34.0, "seconds")))
+            (self.starting_timestamp, self.starting_timestamp + 80.0)
+        for shared_mock in SHARED_MOCKS:
+            shared_mock.reset_mock()
+        self.sim.seq.observatory_model.slew = SLEW_MOCK
+        self.sim.seq.observatory_model.calculate_visit_time = VISIT_TIME_MOCK
         self.sim.seq.observatory_model.target_exposure_list = [exposure_coll1, exposure_coll2]
         self.sim.seq.observatory_model.observation_exposure_list = [exposure_coll3, exposure_coll4]
         self.sim.seq.observatory_model.slew_activities_list = [slew_activity_coll]
-        self.sim.dh.write_downtime_to_db = mock.Mock()
-        self.sim.cloud_interface.write_to_db = mock.Mock()
-        self.sim.seeing_interface.write_to_db = mock.Mock()
+        self.sim.dh.write_downtime_to_db = WRITE_DOWNTIME_MOCK
+        self.sim.cloud_interface.write_to_db = WRITE_CLOUD_MOCK
+        self.sim.seeing_interface.write_to_db = WRITE_SEEING_MOCK
 
         self.assertEqual(self.sim.duration, 1.0)
 
-    @mock.patch("lsst.sims.ocs.sal.sal_manager.SalManager.put")
-    def xtest_run_no_scheduler(self, mock_salmanager_put):
-        self.short_run(False)
+    def scheduler_mocks(self, need_swap=False):
+        # Need to make Scheduler wait break conditions work.
+        mock_ss = self.mock_salscheduler.return_value
+        mock_ss.configure_mock(**SCHEDULER_RETURN_VALUES)
 
-        self.sim.initialize()
-        self.sim.run()
+        # Walk the Scheduler through OFFLINE -> STANDBY -> DISABLE during initialization.
+        summary_states = iter([self.sim.summary_state_enum[name]
+                               for name in ("OFFLINE", "STANDBY", "DISABLE")])
 
-        self.assertEqual(mock_salmanager_put.call_count, self.put_calls)
-        self.assertEqual(self.sim.seq.targets_received, self.num_visits)
-        self.assertEqual(self.sim.seq.observations_made, self.num_visits)
+        def summary_state_side_effect(topic):
+            topic.summaryState = next(summary_states, self.sim.summary_state_enum["DISABLE"])
+            return mock.DEFAULT
 
-    @mock.patch("SALPY_scheduler.SAL_scheduler")
-    @mock.patch("lsst.sims.ocs.sal.sal_manager.SalManager.put")
-    def test_run_with_scheduler(self, mock_salmanager_put, mock_salscheduler):
-        self.short_run(True)
-        get_calls = 1 * self.num_visits
+        def valid_settings_side_effect(topic):
+            topic.packageVersions = self.options.config_version
+            return mock.DEFAULT
+
+        def filter_swap_side_effect(topic):
+            topic.needSwap = need_swap
+            topic.filterToUnmount = 'z'
+            return mock.DEFAULT
+
+        mock_ss.getEvent_summaryState.side_effect = summary_state_side_effect
+        mock_ss.getEvent_validSettings.side_effect = valid_settings_side_effect
+        mock_ss.getEvent_needFilterSwap.side_effect = filter_swap_side_effect
 
         self.sim.initialize()
-        # Need to make Scheduler wait break conditions work.
-        mock_ss = mock_salscheduler()
         # Targets
-        mock_ss.getNextSample_target = mock.MagicMock(return_value=0)
-        self.sim.target.num_exposures = 2
+        self.sim.target.numExposures = 2
         self.sim.target.filter = 'r'
-        self.sim.target.num_proposals = 1
-        for i in range(self.sim.target.num_proposals):
-            self.sim.target.proposal_Ids[i] = i + 1
-        # Filter Swap
-        mock_ss.getNextSample_filterSwap = mock.MagicMock(return_value=0)
         # Interested Proposal
-        mock_ss.getNextSample_interestedProposal = mock.MagicMock(return_value=0)
         self.sim.interested_proposal.observationId = 10
-        self.sim.interested_proposal.num_proposals = 1
-        for i in range(self.sim.interested_proposal.num_proposals):
-            self.sim.interested_proposal.proposal_Ids[i] = i + 1
 
-        def filter_swap_side_effect(*args):
-            topic = self.topic_get(*args)
-            if isinstance(topic, SALPY_scheduler.scheduler_filterSwapC):
-                topic.filter_to_unmount = 'z'
-            return topic
+        return mock_ss
+
+    def test_run_with_scheduler(self):
+        self.short_run()
+        get_calls = 1 * self.num_visits
 
-        self.sim.sal.get_topic = mock.MagicMock(side_effect=filter_swap_side_effect)
+        mock_ss = self.scheduler_mocks()
+        self.sim.target.numProposals = 1
+        for i in range(self.sim.target.numProposals):
+            self.sim.target.proposalId[i] = i + 1
+        self.sim.interested_proposal.numProposals = 1
+        for i in range(self.sim.interested_proposal.numProposals):
+            self.sim.interested_proposal.proposalIds[i] = i + 1
 
         # TargetHistory, ObsHistory, SlewHistory, SlewActivity, SlewInitialState, SlewFinalState
         # SlewMaxSpeeds, 2 * TargetExposures, 2 * ObsExposures, TargetProposalHistory, ObsProposalHistory
@@ -175,77 +202,34 @@ class SimulatorTest(unittest.TestCase):
 
         self.sim.run()
 
-        self.assertEqual(mock_salmanager_put.call_count, self.put_calls)
+        self.assertEqual(self.mock_salmanager_put.call_count, self.put_calls)
         # self.assertEqual(mock_ss.getNextSample_field.call_count, 2)
-        self.assertEqual(mock_ss.getNextSample_target.call_count, get_calls)
-        self.assertEqual(mock_ss.getNextSample_filterSwap.call_count, 1)
+        self.assertEqual(mock_ss.getEvent_target.call_count, get_calls)
+        self.assertEqual(mock_ss.getEvent_needFilterSwap.call_count, 1)
         self.assertEqual(self.sim.seq.targets_received, self.num_visits)
         self.assertEqual(self.sim.seq.observations_made, self.num_visits)
-        self.assertEqual(self.mock_socs_db.clear_data.call_count, self.num_nights)
-        self.assertEqual(self.mock_socs_db.append_data.call_count,
-                         self.num_visits * DATABASE_APPEND_DATA_CALLS)
-        self.assertEqual(self.mock_socs_db.write.call_count, self.num_nights)
-
-    @mock.patch("SALPY_scheduler.SAL_scheduler")
-    @mock.patch("lsst.sims.ocs.sal.sal_manager.SalManager.put")
-    def test_run_with_scheduler_and_filter_swap(self, mock_salmanager_put, mock_salscheduler):
-        self.short_run(True)
+        db_call_counts = (self.mock_socs_db.clear_data.call_count,
+                          self.mock_socs_db.append_data.call_count,
+                          self.mock_socs_db.write.call_count)
+        self.assertEqual(db_call_counts,
+                         (self.num_nights, self.num_visits * DATABASE_APPEND_DATA_CALLS, self.num_nights))
 
-        self.sim.initialize()
-        # Need to make Scheduler wait break conditions work.
-        mock_ss = mock_salscheduler()
-        # Targets
-        mock_ss.getNextSample_target = mock.MagicMock(return_value=0)
-        self.sim.target.num_exposures = 2
-        self.sim.target.filter = 'r'
-        # Filter Swap
-        mock_ss.getNextSample_filterSwap = mock.MagicMock(return_value=0)
-        # Interested Proposal
-        mock_ss.getNextSample_interestedProposal = mock.MagicMock(return_value=0)
-        self.sim.interested_proposal.observationId = 10
+    def test_run_with_scheduler_and_filter_swap(self):
+        self.short_run()
 
-        def filter_swap_side_effect(*args):
-            topic = self.topic_get(*args)
-            if isinstance(topic, SALPY_scheduler.scheduler_filterSwapC):
-                topic.need_swap = True
-                topic.filter_to_unmount = 'z'
-            return topic
-
-        self.sim.sal.get_topic = mock.MagicMock(side_effect=filter_swap_side_effect)
+        mock_ss = self.scheduler_mocks(need_swap=True)
 
         self.sim.seq.start_day = mock.MagicMock(return_value=None)
 
         self.sim.run()
 
-        self.assertTrue(mock_ss.getNextSample_filterSwap.called)
+        self.assertTrue(mock_ss.getEvent_needFilterSwap.called)
         self.assertTrue(self.sim.seq.start_day.called)
 
-    @mock.patch("SALPY_scheduler.SAL_scheduler")
-    @mock.patch("lsst.sims.ocs.sal.sal_manager.SalManager.put")
-    def test_run_with_scheduler_and_downtime(self, mock_salmanager_put, mock_salscheduler):
-        self.short_run(True)
-
-        self.sim.initialize()
-        # Need to make Scheduler wait break conditions work.
-        mock_ss = mock_salscheduler()
-        # Targets
-        mock_ss.getNextSample_target = mock.MagicMock(return_value=0)
-        self.sim.target.num_exposures = 2
-        self.sim.target.filter = 'r'
-        # Filter swap
-        mock_ss.getNextSample_filterSwap = mock.MagicMock(return_value=0)
-        # Interested Proposal
-        mock_ss.getNextSample_interestedProposal = mock.MagicMock(return_value=0)
-        self.sim.interested_proposal.observationId = 10
-
-        def filter_swap_side_effect(*args):
-            topic = self.topic_get(*args)
-            if isinstance(topic, SALPY_scheduler.scheduler_filterSwapC):
-                topic.need_swap = False
-                topic.filter_to_unmount = 'z'
-            return topic
+    def test_run_with_scheduler_and_downtime(self):
+        self.short_run()
 
-        self.sim.sal.get_topic = mock.MagicMock(side_effect=filter_swap_side_effect)
+        mock_ss = self.scheduler_mocks()
 
         self.sim.dh.get_downtime = mock.Mock(return_value=1)
         self.sim.seq.start_day = mock.MagicMock(return_value=None)
@@ -253,5 +237,43 @@ class SimulatorTest(unittest.TestCase):
         self.sim.run()
 
         self.assertEqual(self.sim.dh.get_downtime.call_count, self.num_nights)
-        self.assertEqual(mock_ss.getNextSample_target.call_count, 0)
+        self.assertTrue(self.sim.comm_time.isDown)
+        self.assertEqual(self.sim.comm_time.downDuration, 1)
+        self.assertEqual(mock_ss.getEvent_target.call_count, 0)
         self.assertEqual(self.sim.seq.start_day.call_count, 1)
+
+    def start_night_mocks(self, down_days):
+        self.sim.comm_time = self.topic_get("timeHandler")
+        self.sim.sal = mock.MagicMock()
+        self.sim.time_handler = mock.MagicMock()
+        self.sim.time_handler.current_timestamp = self.starting_timestamp
+        self.sim.seq = mock.MagicMock()
+        self.sim.seq.sky_model.get_night_boundaries.return_value = (self.starting_timestamp,
+                                                                    self.starting_timestamp + 80.0)
+        self.sim.dh.get_downtime = mock.Mock(return_value=down_days)
+
+    def test_start_night(self):
+        self.start_night_mocks(0)
+
+        self.sim.start_night(1)
+
+        self.sim.dh.get_downtime.assert_called_once_with(1)
+        self.assertFalse(self.sim.comm_time.isDown)
+        self.assertEqual(self.sim.comm_time.downDuration, 0)
+        self.assertEqual(self.sim.end_of_night, self.starting_timestamp + 80.0)
+        self.assertFalse(self.sim.seq.get_observatory_state.called)
+        self.assertFalse(self.sim.sal.put.called)
+
+    def test_start_night_with_downtime(self):
+        self.start_night_mocks(1)
+        observatory_state = self.sim.seq.get_observatory_state.return_value
+
+        self.sim.start_night(1)
+
+        self.assertTrue(self.sim.comm_time.isDown)
+        self.assertEqual(self.sim.comm_time.downDuration, 1)
+        self.assertEqual(self.sim.comm_time.timestamp, self.starting_timestamp)
+        self.sim.seq.get_observatory_state.assert_called_once_with(self.starting_timestamp)
+        self.assertEqual(self.sim.sal.put.call_args_list,
+                         [mock.call(self.sim.comm_time), mock.call(observatory_state)])
+        self.sim.time_handler.update_time.assert_called_with(140.0, "seconds")
@@ -45,6 +45,15 @@ class TimeHandlerTest(unittest.TestCase):
         self.assertEqual(self.th.current_timestamp, truth_timestamp)
         self.assertNotEqual(self.th.current_timestamp, self.th.initial_timestamp)
 
+    def test_timestamp_after_setting_current_datetime(self):
+        truth_timestamp = (datetime(2020, 5, 25, 6, 0, 0) - datetime(1970, 1, 1)).total_seconds()
+        self.th.current_dt = datetime(2020, 5, 25, 6, 0, 0)
+        self.assertEqual(self.th.current_timestamp, truth_timestamp)
+
+    def test_current_timestamp_is_read_only(self):
+        with self.assertRaises(AttributeError):
+            self.th.current_timestamp = 0.0
+
     def test_current_timestamp_string(self):
         self.assertEqual(self.th.current_timestring, "2020-05-24T00:00:00")
 
@@ -59,6 +59,16 @@ class SalManagerTest(unittest.TestCase):
         self.sal.put(topic)
         self.assertTrue(mock_sal_put_sample.called)
 
+    @mock.patch("SALPY_scheduler.SAL_scheduler.putSample_timeHandler")
+    @mock.patch("SALPY_scheduler.SAL_scheduler.salTelemetryPub")
+    def test_publishing_topic_multiple_times(self, mock_sal_telemetry_sub, mock_sal_put_sample):
+        self.sal.initialize()
+        topic = self.sal.set_publish_topic(self.publish_topic)
+        self.sal.put(topic)
+        self.sal.put(topic)
+        self.assertEqual(mock_sal_put_sample.call_count, 2)
+        self.assertEqual(len(self.sal._put_functions), 1)
+
     def test_get_topic(self):
         self.sal.initialize()
         topic = self.sal.get_topic(self.publish_topic)
@@ -4,8 +4,9 @@ from lsst.sims.ocs.setup.parser import create_parser
 
 class ArgParserTest(unittest.TestCase):
 
-    def setUp(self):
-        self.parser = create_parser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = create_parser()
 
     def test_parser_creation(self):
         self.assertIsNotNone(self.parser)
@@ -63,20 +63,28 @@ class LogTest(unittest.TestCase):
         self.assertEqual(console_detail, 2)
         self.assertEqual(file_detail, 5)
 
-    def test_configure_logging(self):
+    @mock.patch("logging.handlers.QueueListener")
+    def test_configure_logging(self, mock_listener):
         configure_logging(2, 3)
         self.assertEqual(len(logging.getLogger().handlers), 2)
         self.assertEqual(logging.getLogger().getEffectiveLevel(), logging.DEBUG)
         handler = logging.getLogger().handlers[-1]
-        self.assertIsInstance(handler, logging.handlers.SocketHandler)
-        self.assertEqual(handler.port, logging.handlers.DEFAULT_TCP_LOGGING_PORT)
+        self.assertIsInstance(handler, logging.handlers.QueueHandler)
+        self.assertTrue(mock_listener.return_value.start.called)
+        socket_handler = mock_listener.call_args[0][1]
+        self.assertIsInstance(socket_handler, logging.handlers.SocketHandler)
+        self.assertEqual(socket_handler.port, logging.handlers.DEFAULT_TCP_LOGGING_PORT)
 
-    def test_configure_logging_different_port(self):
+    @mock.patch("logging.handlers.QueueListener")
+    def test_configure_logging_different_port(self, mock_listener):
         port = 21683
         logging.getLogger().handlers = []
         configure_logging(2, 3, port)
         self.assertEqual(len(logging.getLogger().handlers), 2)
         self.assertEqual(logging.getLogger().getEffectiveLevel(), logging.DEBUG)
         handler = logging.getLogger().handlers[-1]
-        self.assertIsInstance(handler, logging.handlers.SocketHandler)
-        self.assertEqual(handler.port, port)
+        self.assertIsInstance(handler, logging.handlers.QueueHandler)
+        self.assertTrue(mock_listener.return_value.start.called)
+        socket_handler = mock_listener.call_args[0][1]
+        self.assertIsInstance(socket_handler, logging.handlers.SocketHandler)
+        self.assertEqual(socket_handler.port, port)